@@ -1,36 +1,53 @@
 # Import necessary modules
+import io
 import os
 import random
+import string
+import struct
 import logging
+from logging.handlers import MemoryHandler
 import time
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from functools import lru_cache
 
-import faker
 import yaml
+import numpy as np
 import psycopg2
 from psycopg2 import sql
-from psycopg2.extras import execute_values
 from faker import Faker
 from tqdm import tqdm  # Progress bar
 
 
 # ---------- Logging Setup ----------
-def setup_logger(name, log_file, level=logging.INFO):
-    """Helper to set up individual loggers for modular logging."""
+def setup_logger(name, log_file, level=logging.INFO, capacity=10000):
+    """
+    Helper to set up individual loggers for modular logging.
+    Records are buffered and written to the file in batches of `capacity`;
+    ERROR and above (and interpreter exit) flush the buffer immediately.
+    """
     handler = logging.FileHandler(log_file)
     handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+    buffered = MemoryHandler(capacity=capacity, flushLevel=logging.ERROR, target=handler)
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    logger.addHandler(handler)
+    logger.addHandler(buffered)
     return logger
 
 
 # Create category loggers
 db_logger = setup_logger("db", "db_connection.log")
-mask_logger = setup_logger("mask", "data_masking.log")
+mask_logger = setup_logger("mask", "data_masking.log", level=logging.WARNING)
 populate_logger = setup_logger("populate", "data_population.log")
 
+def flush_logs():
+    """Write out the buffered records of every file logger."""
+    for logger in (db_logger, mask_logger, populate_logger):
+        for handler in logger.handlers:
+            handler.flush()
+
 # Root logger to console
 logging.basicConfig(
     level=logging.INFO,
@@ -39,6 +56,157 @@ logging.basicConfig(
 )
 
 
+# ---------- Random generators ----------
+# Shared NumPy generator so whole columns can be sampled in one call
+rng = np.random.default_rng()
+# One Faker instance reused by every creator (building a Faker is expensive)
+fake = Faker()
+
+EMAIL_DOMAINS = ("gmail.com", "yahoo.com", "yahoo.co.uk", "hotmail.com", "live.co.uk", "yahoomail.com")
+# Phone numbers are drawn as 11-digit integers
+PHONE_MIN, PHONE_MAX = 10**10, 10**11
+# Values drawn per Faker provider for faker_pool
+POOL_SIZE = 2000
+
+@lru_cache(maxsize=None)
+def faker_pool(faker, provider):
+    """
+    Draw POOL_SIZE values from a Faker provider (e.g. "first_name") once per process.
+    Creators sample whole columns from the pool with NumPy instead of calling Faker per row;
+    repeats in the pool keep Faker's frequency weighting.
+    """
+    generate = getattr(faker, provider)
+    return np.array([generate() for _ in range(POOL_SIZE)])
+
+
+# ---------- SQL statements and table layouts ----------
+# Column layouts for copy_binary: (column_name, pg_type), in the order the creators build rows
+STORES_COLUMNS = (
+    ("store_id", "int4"),
+    ("address", "text"),
+    ("city", "text"),
+    ("phone_number", "text"),
+    ("opened_at", "timestamp"),
+)
+CUSTOMERS_COLUMNS = (
+    ("customer_id", "int4"),
+    ("first_name", "text"),
+    ("last_name", "text"),
+    ("email", "text"),
+    ("phone_number", "text"),
+    ("created_at", "timestamp"),
+)
+INGREDIENTS_COLUMNS = (
+    ("ingredient_id", "int4"),
+    ("name", "text"),
+    ("stock_quantity", "numeric"),
+    ("unit", "text"),
+)
+MENU_ITEMS_COLUMNS = (
+    ("item_id", "int4"),
+    ("name", "text"),
+    ("category", "text"),
+    ("size", "text"),
+    ("price", "numeric"),
+)
+ITEM_INGREDIENTS_COLUMNS = (
+    ("item_id", "int4"),
+    ("ingredient_id", "int4"),
+    ("quantity_required", "numeric"),
+)
+ORDERS_COLUMNS = (
+    ("order_id", "int4"),
+    ("customer_id", "int4"),
+    ("store_id", "int4"),
+    ("order_timestamp", "timestamp"),
+    ("total_amount", "numeric"),
+    ("status", "text"),
+)
+ORDER_ITEMS_COLUMNS = (
+    ("order_id", "int4"),
+    ("item_id", "int4"),
+    ("quantity", "int4"),
+    ("price_at_time_of_order", "numeric"),
+)
+
+# Claims a block of `count` ids from a SERIAL column's sequence (see reserve_ids)
+SQL_RESERVE_IDS = (
+    "SELECT setval(pg_get_serial_sequence(%(table)s, %(column)s), "
+    "nextval(pg_get_serial_sequence(%(table)s, %(column)s)) + %(count)s - 1)"
+)
+
+# Indexes of a schema that no constraint depends on (see prepare_bulk_load)
+SQL_SECONDARY_INDEXES = """
+    SELECT i.indexname, i.indexdef
+    FROM pg_indexes i
+    JOIN pg_namespace n ON n.nspname = i.schemaname
+    JOIN pg_class c ON c.relname = i.indexname AND c.relnamespace = n.oid
+    WHERE i.schemaname = %s
+      AND NOT EXISTS (SELECT 1 FROM pg_constraint con WHERE con.conindid = c.oid)
+"""
+
+SQL_LOAD_MENU_PRICES = "SELECT item_id, price FROM menu_items ORDER BY item_id"
+
+# Orders and order items generated in one statement (see create_orders_server_side)
+SQL_SERVER_SIDE_ORDERS = """
+    WITH params AS (
+        SELECT %(customer_ids)s::int[] AS customer_ids,
+               %(store_ids)s::int[] AS store_ids,
+               %(menu_ids)s::int[] AS menu_ids,
+               %(menu_prices)s::numeric[] AS menu_prices
+    ),
+    new_orders AS MATERIALIZED (
+        SELECT nextval(pg_get_serial_sequence('orders', 'order_id'))::int AS order_id,
+               -- pick a customer or NULL (guest)
+               CASE WHEN random() < %(guest_rate)s THEN NULL
+                    ELSE p.customer_ids[1 + floor(random() * cardinality(p.customer_ids))::int]
+               END AS customer_id,
+               p.store_ids[1 + floor(random() * cardinality(p.store_ids))::int] AS store_id,
+               (now() AT TIME ZONE 'UTC') - make_interval(secs => floor(random() * %(window_seconds)s)) AS order_timestamp,
+               (ARRAY['Pending', 'Preparing', 'Completed', 'Cancelled'])[1 + floor(random() * 4)::int] AS status,
+               -- normal(avg, 1) item count via Box-Muller, clipped to [1, max_items]
+               least(%(max_items)s, greatest(1, trunc(%(avg_items)s + sqrt(-2 * ln(1 - random())) * cos(2 * pi() * random()))))::int AS item_count
+        FROM params p
+        CROSS JOIN generate_series(1, %(num_orders)s)
+    ),
+    picks AS MATERIALIZED (
+        SELECT o.order_id,
+               1 + floor(random() * cardinality(p.menu_ids))::int AS pick,
+               1 + floor(random() * 3)::int AS quantity,
+               1 + (random() * 0.15 - 0.05) AS price_mult
+        FROM new_orders o
+        CROSS JOIN params p
+        CROSS JOIN LATERAL generate_series(1, o.item_count)
+    ),
+    new_items AS MATERIALIZED (
+        SELECT k.order_id,
+               p.menu_ids[k.pick] AS item_id,
+               k.quantity,
+               round(p.menu_prices[k.pick] * k.price_mult::numeric, 2) AS price_at_time_of_order
+        FROM picks k
+        CROSS JOIN params p
+    ),
+    order_totals AS (
+        SELECT order_id, sum(quantity * price_at_time_of_order) AS total_amount
+        FROM new_items
+        GROUP BY order_id
+    ),
+    inserted_orders AS (
+        INSERT INTO orders (order_id, customer_id, store_id, order_timestamp, total_amount, status)
+        SELECT o.order_id, o.customer_id, o.store_id, o.order_timestamp, t.total_amount, o.status
+        FROM new_orders o
+        JOIN order_totals t USING (order_id)
+    ),
+    inserted_items AS (
+        INSERT INTO order_items (order_id, item_id, quantity, price_at_time_of_order)
+        SELECT order_id, item_id, quantity, price_at_time_of_order
+        FROM new_items
+    )
+    SELECT (SELECT count(*) FROM new_orders), count(*), coalesce(sum(quantity * price_at_time_of_order), 0)
+    FROM new_items
+"""
+
+
 # ---------- Configuration loading ----------
 def load_config(yaml_path="dbconfig.yaml"):
     """
@@ -79,7 +247,9 @@ def get_conn(cfg):
             port=cfg["port"],
             user=cfg["user"],
             password=cfg["password"],
-            dbname=cfg["dbname"]
+            dbname=cfg["dbname"],
+            # set at connection start-up instead of a separate SET round-trip
+            options="-c search_path=pizzeria"
         )
         db_logger.info(
             f"Database connection established successfully to '{cfg['dbname']}' at host '{cfg['host']}'."
@@ -90,7 +260,202 @@ def get_conn(cfg):
         raise
 
 
+# ---------- Binary COPY ----------
+# PostgreSQL binary COPY framing: signature, flags field and header extension length
+PGCOPY_HEADER = b"PGCOPY\n\377\r\n\0" + struct.pack(">ii", 0, 0)
+PGCOPY_TRAILER = struct.pack(">h", -1)
+PGCOPY_NULL = struct.pack(">i", -1)
+PG_EPOCH = datetime(2000, 1, 1)
+# Bytes handed to the server per copy_expert read, and rows converted per chunk by iter_rows
+COPY_READ_SIZE = 1 << 16
+ROW_CHUNK = 10000
+
+
+def _encode_int4(value):
+    return struct.pack(">i", value)
+
+def _encode_text(value):
+    return str(value).encode("utf-8")
+
+def _encode_timestamp(value):
+    """
+    TIMESTAMP (without time zone) is sent as microseconds since 2000-01-01.
+    Aware datetimes are stored as their UTC wall-clock time.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return struct.pack(">q", (value - PG_EPOCH) // timedelta(microseconds=1))
+
+def _encode_numeric(value):
+    """
+    NUMERIC is sent as base-10000 digit groups:
+    ndigits, weight (of the first group), sign, display scale, then the groups.
+    Example: 12.34 -> ndigits=2, weight=0, sign=+, dscale=2, groups [12, 3400]
+    """
+    sign, digits, exponent = Decimal(str(value)).as_tuple()
+    dscale = max(0, -exponent)
+    digit_str = "".join(map(str, digits))
+    if exponent >= 0:
+        int_part, frac_part = digit_str + "0" * exponent, ""
+    else:
+        digit_str = digit_str.rjust(dscale + 1, "0")
+        int_part, frac_part = digit_str[:exponent], digit_str[exponent:]
+
+    int_part = int_part.rjust(-(-len(int_part) // 4) * 4, "0")
+    frac_part = frac_part.ljust(-(-len(frac_part) // 4) * 4, "0")
+    groups = [int(int_part[i:i+4]) for i in range(0, len(int_part), 4)]
+    weight = len(groups) - 1
+    groups += [int(frac_part[i:i+4]) for i in range(0, len(frac_part), 4)]
+
+    # strip leading/trailing zero groups (the weight follows the first non-zero group)
+    while groups and groups[0] == 0:
+        groups.pop(0)
+        weight -= 1
+    while groups and groups[-1] == 0:
+        groups.pop()
+    if not groups:
+        weight = 0
+
+    header = struct.pack(">hhHH", len(groups), weight, 0x4000 if sign else 0x0000, dscale)
+    return header + struct.pack(f">{len(groups)}H", *groups)
+
+
+COPY_ENCODERS = {
+    "int4": _encode_int4,
+    "text": _encode_text,
+    "numeric": _encode_numeric,
+    "timestamp": _encode_timestamp,
+}
+
+
+class CopyBinaryStream(io.RawIOBase):
+    """
+    Read-only file object that encodes rows to the binary COPY format lazily, as
+    copy_expert reads from it, so only about one read's worth of bytes is held at a time.
+    - cols: sequence of (column_name, pg_type) pairs, as for copy_binary
+    - rows: iterable (e.g. a generator) of tuples in the same column order
+    """
+    _END = object()
+
+    def __init__(self, cols, rows):
+        super().__init__()
+        self._encoders = [COPY_ENCODERS[pg_type] for _, pg_type in cols]
+        self._field_count = struct.pack(">h", len(cols))
+        self._rows = iter(rows)
+        self._buf = bytearray(PGCOPY_HEADER)
+        self._exhausted = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        # refill until the caller's buffer can be filled or the rows run out
+        while len(self._buf) < len(b) and not self._exhausted:
+            row = next(self._rows, self._END)
+            if row is self._END:
+                self._buf += PGCOPY_TRAILER
+                self._exhausted = True
+            else:
+                self._encode_row(row)
+        n = min(len(b), len(self._buf))
+        b[:n] = self._buf[:n]
+        del self._buf[:n]
+        return n
+
+    def _encode_row(self, row):
+        buf = self._buf
+        buf += self._field_count
+        for encode, value in zip(self._encoders, row):
+            if value is None:
+                buf += PGCOPY_NULL
+                continue
+            payload = encode(value)
+            buf += struct.pack(">i", len(payload))
+            buf += payload
+
+
+@lru_cache(maxsize=None)
+def copy_statement(table, columns):
+    """Compose (once per table and column list) the COPY ... FROM STDIN (FORMAT BINARY) statement."""
+    return sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT BINARY)").format(
+        sql.Identifier(table),
+        sql.SQL(", ").join(sql.Identifier(name) for name in columns)
+    )
+
+def copy_binary(cur, table, cols, rows):
+    """
+    Bulk load rows into table with COPY ... FROM STDIN (FORMAT BINARY).
+    - cols: sequence of (column_name, pg_type) pairs; pg_type picks the encoder
+      from COPY_ENCODERS (int4, text, numeric, timestamp)
+    - rows: iterable of tuples in the same column order, None is sent as NULL;
+      rows are encoded as they are streamed, so a generator keeps memory bounded
+    Returns: number of rows copied.
+    """
+    copy_sql = copy_statement(table, tuple(name for name, _ in cols))
+    cur.copy_expert(copy_sql, CopyBinaryStream(cols, rows), size=COPY_READ_SIZE)
+    return cur.rowcount
+
+def iter_rows(*columns, chunk_size=ROW_CHUNK):
+    """
+    Yield row tuples from equal-length columns (NumPy arrays, lists or ranges),
+    converting one chunk at a time to Python objects instead of the whole table.
+    """
+    for start in range(0, len(columns[0]), chunk_size):
+        chunk = [col[start:start+chunk_size] for col in columns]
+        yield from zip(*(c.tolist() if isinstance(c, np.ndarray) else c for c in chunk))
+
+def reserve_ids(cur, table, column, count):
+    """
+    Reserve `count` consecutive values of a SERIAL column's sequence in one round-trip,
+    so rows can be COPYed with their ids already assigned (no RETURNING needed).
+    The sequence is left past the reserved block, so later default ids don't collide.
+    Returns: range of the reserved ids.
+    """
+    if count <= 0:
+        return range(0)
+    cur.execute(SQL_RESERVE_IDS, {"table": table, "column": column, "count": count})
+    last_id = cur.fetchone()[0]
+    return range(last_id - count + 1, last_id + 1)
+
+
+# ---------- Bulk load tuning ----------
+# Tables in foreign-key dependency order (parents first), as created in pizzeria_schema.sql
+TABLES = ["stores", "customers", "ingredients", "menu_items", "item_ingredients", "orders", "order_items"]
+
+def prepare_bulk_load(cur, schema="pizzeria"):
+    """
+    Make the tables cheap to bulk load: switch them to UNLOGGED so the inserts skip the
+    WAL, and drop the secondary indexes so they are built once at the end instead of
+    maintained row by row. Indexes backing a primary key or unique constraint are kept.
+    Returns: dict of index name -> CREATE INDEX statement, for finish_bulk_load.
+    """
+    cur.execute(SQL_SECONDARY_INDEXES, (schema,))
+    index_ddl = dict(cur.fetchall())
+    for name in index_ddl:
+        cur.execute(sql.SQL("DROP INDEX {}").format(sql.Identifier(schema, name)))
+
+    # a logged table may not be referenced by an unlogged one, so children go first
+    for table in reversed(TABLES):
+        cur.execute(sql.SQL("ALTER TABLE {} SET UNLOGGED").format(sql.Identifier(schema, table)))
+    populate_logger.info(f"Tables set UNLOGGED and {len(index_ddl)} secondary indexes dropped for bulk load.")
+    return index_ddl
+
+def finish_bulk_load(cur, index_ddl, schema="pizzeria"):
+    """
+    Undo prepare_bulk_load: make the tables durable again (parents first) and
+    recreate the dropped indexes from their saved definitions.
+    """
+    for table in TABLES:
+        cur.execute(sql.SQL("ALTER TABLE {} SET LOGGED").format(sql.Identifier(schema, table)))
+    for ddl in index_ddl.values():
+        cur.execute(ddl)
+    populate_logger.info(f"Tables set LOGGED and {len(index_ddl)} secondary indexes recreated.")
+
+
 # ---------- Masking ----------
+# Translation table that deletes every printable non-digit character
+_DIGIT_ONLY = str.maketrans('', '', ''.join(sorted(set(string.printable) - set(string.digits))))
+
 def mask_email(email: str) -> str:
     """
     Simple masking: keep first char of local part and domain intact,
@@ -102,37 +467,25 @@ def mask_email(email: str) -> str:
         return email
     
     local, domain = email.split('@', 1)
-    if len(local) <= 2:
-        masked_local = local[0] + "*"*(len(local)-1)
-    else:
-        masked_local = local[0] + "*"*(len(local)-1)
-
-    masked_email = f"{masked_local}@{domain}"
-    mask_logger.info(f"Masked email: {email} -> {masked_email}")
-    return masked_email
+    return f"{local[0]}{'*' * (len(local) - 1)}@{domain}"
 
 def mask_phone(phone: str) -> str:
     """
     Keep last 4 digits, replace other characters with * (simple).
-    Non-digits preserved for readability but masked in digits.
+    Non-digit characters are stripped before masking.
     """
     if not phone:
         mask_logger.warning("Empty or No phone number provided for masking.")
         return phone
     
-    digits = [c for c in phone if c.isdigit()]
+    digits = phone.translate(_DIGIT_ONLY)
     if not digits:
         mask_logger.warning(f"No digits found in phone number: {phone}")
         return phone
     
     if len(digits) <= 4:
-        masked_digits = "*" * len(digits)
-    else:
-        last4 = ''.join(digits[-4:])
-        masked_digits = "*" * (len(digits) - 4) + last4
-
-    mask_logger.info(f"Masked phone: {phone} -> {masked_digits}")
-    return masked_digits
+        return "*" * len(digits)
+    return "*" * (len(digits) - 4) + digits[-4:]
 
 
 # ---------- Data creation functions ----------
@@ -140,58 +493,70 @@ def mask_phone(phone: str) -> str:
 def create_stores(cur, faker, num_stores=5):
     populate_logger.info(f"Starting to create {num_stores} stores...")
     stores = []
-    for _ in tqdm(range(num_stores), desc="Creating stores", colour="green"):
-        address = faker.address().replace('\n', ', ')
-        city = f"{faker.city()} RushMore Pizzeria"
-        phone_number = faker.unique.msisdn()[:20]
-        opened_at = faker.date_time_this_decade(tzinfo=timezone.utc)
+    # store phone numbers are stored unmasked, so sample them without replacement
+    phone_numbers = random.sample(range(PHONE_MIN, PHONE_MAX), num_stores)
+    _address, _city, _opened_at = faker.address, faker.city, faker.date_time_this_decade
+    for i in tqdm(range(num_stores), desc="Creating stores", colour="green"):
+        address = _address().replace('\n', ', ')
+        city = f"{_city()} RushMore Pizzeria"
+        phone_number = str(phone_numbers[i])
+        opened_at = _opened_at(tzinfo=timezone.utc)
         stores.append((address, city, phone_number, opened_at))
 
-    insert = "INSERT INTO stores (address, city, phone_number, opened_at) VALUES %s RETURNING store_id"
     try:
-        rows = execute_values(cur, insert, stores, fetch=True)
-        store_ids = [row[0] for row in rows]
+        store_ids = list(reserve_ids(cur, "stores", "store_id", len(stores)))
+        rows = [(store_id, *store) for store_id, store in zip(store_ids, stores)]
+        copy_binary(cur, "stores", STORES_COLUMNS, rows)
         populate_logger.info(f"Inserted {len(store_ids)} stores successfully.")
         return store_ids
     except Exception as e:
         populate_logger.exception(f"Error inserting stores: {e}")
         raise
 
+def gen_customers(faker, customer_ids, chunk_size=ROW_CHUNK):
+    """
+    Yield customer rows for the given ids, drawing the random columns one chunk at a
+    time so memory stays bounded (apart from the masked values kept for uniqueness).
+    """
+    # how many times each masked value has been used, for O(1) collision checks
+    seen_emails = {}
+    seen_phones = {}
+    first_name_pool = faker_pool(faker, "first_name")
+    last_name_pool = faker_pool(faker, "last_name")
+    _created_at = faker.date_time_this_year
+    for start in range(0, len(customer_ids), chunk_size):
+        ids = customer_ids[start:start+chunk_size]
+        n = len(ids)
+        # draw the random parts for the chunk up front; the customer id keeps raw emails unique
+        first_names = rng.choice(first_name_pool, n).tolist()
+        last_names = rng.choice(last_name_pool, n).tolist()
+        domains = rng.choice(EMAIL_DOMAINS, n).tolist()
+        raw_phones = rng.integers(PHONE_MIN, PHONE_MAX, n).tolist()
+        for customer_id, first_name, last_name, domain, raw_phone in zip(
+            ids, first_names, last_names, domains, raw_phones
+        ):
+            raw_email = f"{first_name.lower()}.{last_name.lower()}{customer_id}@{domain}"
+            masked_email = mask_email(raw_email)
+            # ensure masked uniqueness by suffixing repeats with a per-value counter;
+            # masked locals never contain "+", so suffixed values can't clash with a plain one
+            n = seen_emails.get(masked_email, 0)
+            seen_emails[masked_email] = n + 1
+            email = masked_email.replace("@", f"+{n}@") if n else masked_email
+            masked_phone = mask_phone(str(raw_phone))
+            # masked phones all have the same length, so the counter suffix can't clash either
+            n = seen_phones.get(masked_phone, 0)
+            seen_phones[masked_phone] = n + 1
+            phone_number = masked_phone + str(n) if n else masked_phone
+            created_at = _created_at(tzinfo=timezone.utc)
+            yield (customer_id, first_name, last_name, email, phone_number, created_at)
+
 def create_customers(cur, faker, num_customers=1000):
     populate_logger.info(f"Starting to create {num_customers} customers...")
-    customers = []
-    email_domains = ["gmail.com", "yahoo.com", "yahoo.co.uk", "hotmail.com", "live.co.uk", "yahoomail.com"]
-    for _ in tqdm(range(num_customers), desc="Creating customers", colour="green"):
-        first_name = faker.first_name()
-        last_name = faker.last_name()
-        local_part = f"{first_name.lower()}.{last_name.lower()}{random.randint(1,9999)}"
-        domain = random.choice(email_domains)
-        email = raw_email = f"{local_part}@{domain}"
-        masked_email = mask_email(raw_email)
-        # ensure masked uniqueness by adding a short suffix if collision detected
-        if any(c[2] == masked_email for c in customers):
-            masked_email = masked_email.replace("@", f"+{random.randint(1000,9999)}@")
-        email = masked_email
-        raw_phone = faker.unique.msisdn()[:20]
-        masked_phone = mask_phone(raw_phone)
-        # ensure masked uniqueness within this batch
-        if any(c[3] == masked_phone for c in customers):
-            masked_phone = masked_phone + str(random.randint(1000, 9999))
-        phone_number = masked_phone
-        created_at = faker.date_time_this_year(tzinfo=timezone.utc)
-        customers.append((first_name, last_name, email, phone_number, created_at))
-
-    insert = ("INSERT INTO customers (first_name, last_name, email, phone_number, created_at) "
-              "VALUES %s RETURNING customer_id")
-
-    ids = []
-    batch_size = 1000
     try:
-        for i in range(0, len(customers), batch_size):
-            chunk = customers[i:i+batch_size]
-            rows = execute_values(cur, insert, chunk, fetch=True)
-            ids.extend([row[0] for row in rows])
-            populate_logger.info(f"Inserted customers: {len(ids)}/{len(customers)}")
+        ids = reserve_ids(cur, "customers", "customer_id", num_customers)
+        # rows are generated while COPY streams them to the server
+        rows = tqdm(gen_customers(faker, ids), total=num_customers, desc="Creating customers", colour="green")
+        copy_binary(cur, "customers", CUSTOMERS_COLUMNS, rows)
         populate_logger.info(f"Inserted {len(ids)} customers successfully.")
         return ids
     except Exception as e:
@@ -207,21 +572,19 @@ def create_ingredients(cur, faker, num_ingredients=50):
              'Ham', 'Bacon', 'Jalapeno', 'Corn', 'BBQ Sauce']
     
     names = set()
+    _choice, _word = random.choice, faker.word
     while len(names) < num_ingredients:
-        base = random.choice(basic)
-        suffix = f" {faker.word()}" if base in names else ""
+        base = _choice(basic)
+        suffix = f" {_word()}" if base in names else ""
         names.add(base + suffix)
 
-    ing = []
-    for name in names:
-        stock_quantity = random.randint(10, 500)
-        unit = random.choice(['kg', 'liters', 'grams', 'ml', 'pieces'])
-        ing.append((name, stock_quantity, unit))
+    stock_quantities = rng.integers(10, 501, num_ingredients)
+    units = rng.choice(['kg', 'liters', 'grams', 'ml', 'pieces'], num_ingredients)
+    ing = list(zip(names, stock_quantities.tolist(), units.tolist()))
 
-    insert = "INSERT INTO ingredients (name, stock_quantity, unit) VALUES %s RETURNING ingredient_id"
     try:
-        rows = execute_values(cur, insert, ing, fetch=True)
-        ids = [row[0] for row in rows]
+        ids = list(reserve_ids(cur, "ingredients", "ingredient_id", len(ing)))
+        copy_binary(cur, "ingredients", INGREDIENTS_COLUMNS, [(ing_id, *row) for ing_id, row in zip(ids, ing)])
         populate_logger.info(f"Inserted {len(ids)} ingredients successfully.")
         return ids
     except Exception as e:
@@ -230,21 +593,23 @@ def create_ingredients(cur, faker, num_ingredients=50):
 
 def create_menu_items(cur, faker, num_items=30):
     populate_logger.info(f"Starting to create {num_items} menu items...")
-    items = []
     categories = ['Classic', 'Vegetarian/Vegan', 'Gourmet/Special', 'Meat Lovers', 'Seafood', 'Deluxe']
     sizes = ['Small', 'Medium', 'Large', 'Family']
+    styles = ['Margherita', 'Pepperoni Feast', 'Hawaiian', 'Four Cheese', 'Spinach & Feta',
+              'BBQ Chicken', 'Veggie Delight', 'Meat Supreme', 'Seafood Special']
+
+    # every random column in one call each
+    word_col = rng.choice(faker_pool(faker, "word"), num_items).tolist()
+    style_col = rng.choice(styles, num_items).tolist()
+    category_col = rng.choice(categories, num_items).tolist()
+    size_col = rng.choice(sizes, num_items).tolist()
+    price_col = np.round(rng.uniform(5.0, 25.0, num_items), 2).tolist()
+    names = [f"{word.capitalize()} {style}" for word, style in zip(word_col, style_col)]
+    items = list(zip(names, category_col, size_col, price_col))
 
-    for _ in range(num_items):
-        name = f"{faker.word().capitalize()} {random.choice(['Margherita', 'Pepperoni Feast', 'Hawaiian', 'Four Cheese', 'Spinach & Feta', 'BBQ Chicken', 'Veggie Delight', 'Meat Supreme', 'Seafood Special'])}"
-        category = random.choice(categories)
-        size = random.choice(sizes)
-        price = round(random.uniform(5.0, 25.0), 2)
-        items.append((name, category, size, price))
-
-    insert = "INSERT INTO menu_items (name, category, size, price) VALUES %s RETURNING item_id"
     try:
-        rows = execute_values(cur, insert, items, fetch=True)
-        ids = [row[0] for row in rows]
+        ids = list(reserve_ids(cur, "menu_items", "item_id", len(items)))
+        copy_binary(cur, "menu_items", MENU_ITEMS_COLUMNS, [(item_id, *item) for item_id, item in zip(ids, items)])
         populate_logger.info(f"Inserted {len(ids)} menu items successfully.")
         return ids
     except Exception as e:
@@ -253,163 +618,205 @@ def create_menu_items(cur, faker, num_items=30):
 
 def create_item_ingredients(cur, menu_item_ids, ingredient_ids, min_ings=2, max_ings=6):
     populate_logger.info("Starting to create item_ingredients...")
-    rows = []
     # For each menu item assign some ingredients and a quantity_required
-    for item_id in menu_item_ids:
-        num_ings = random.randint(min_ings, max_ings)
-        chosen = random.sample(ingredient_ids, min(num_ings, len(ingredient_ids)))
-        for ing_id in chosen:
-            # quantity_required: realistic small decimal (e.g., grams or ml) — scale depends on unit
-            quantity_required = round(random.uniform(5.0, 300.0), 2)
-            rows.append((item_id, ing_id, quantity_required))
-
-    insert = ("INSERT INTO item_ingredients (item_id, ingredient_id, quantity_required) "
-              "VALUES %s RETURNING item_id, ingredient_id")
+    item_ids = np.asarray(menu_item_ids)
+    ing_ids = np.asarray(ingredient_ids)
+    nums = np.minimum(rng.integers(min_ings, max_ings + 1, len(item_ids)), len(ing_ids))
+    # argsort of a random matrix gives every menu item its own permutation of the ingredients;
+    # keeping the first nums[i] columns of row i samples without replacement
+    width = int(nums.max()) if len(nums) else 0
+    picks = np.argsort(rng.random((len(item_ids), len(ing_ids))), axis=1)[:, :width]
+    keep = np.arange(width) < nums[:, None]
+    item_col = np.repeat(item_ids, nums)
+    ing_col = ing_ids[picks[keep]]
+    # quantity_required: realistic small decimal (e.g., grams or ml) — scale depends on unit
+    qty_col = np.round(rng.uniform(5.0, 300.0, len(item_col)), 2)
+
     try:
-        result = execute_values(cur, insert, rows, fetch=True)
-        populate_logger.info(f"Inserted {len(result)} item_ingredient rows.")
-        return result
+        rows = iter_rows(item_col, ing_col, qty_col)
+        inserted_count = copy_binary(cur, "item_ingredients", ITEM_INGREDIENTS_COLUMNS, rows)
+        populate_logger.info(f"Inserted {inserted_count} item_ingredient rows.")
+        return list(zip(item_col.tolist(), ing_col.tolist()))
     except Exception as e:
         populate_logger.exception(f"Error inserting item_ingredients: {e}")
         raise
 
-def create_orders(cur, customer_ids, store_ids, num_orders=5000, guest_rate=0.10):
+# Upper bound for the number of items sampled per order
+MAX_ITEMS_PER_ORDER = 12
+
+def load_menu_prices(cur):
+    """
+    Load the menu once as two aligned NumPy arrays so item prices can be gathered
+    with an index array instead of a dict lookup per order item.
+    Returns: (menu_ids, menu_prices)
+    """
+    cur.execute(SQL_LOAD_MENU_PRICES)
+    menu_rows = cur.fetchall()
+    if not menu_rows:
+        raise RuntimeError("No menu_items found — cannot create order_items.")
+    menu_ids = np.array([r[0] for r in menu_rows])
+    menu_prices = np.array([r[1] for r in menu_rows], dtype=np.float64)
+    return menu_ids, menu_prices
+
+def create_orders(cur, customer_ids, store_ids, menu_ids, menu_prices, num_orders=5000,
+                  guest_rate=0.10, avg_items_per_order=5):
     """
-    Create orders entries. total_amount is set to 0 initially — it will be computed/updated
-    after order_items are created (see create_order_items).
+    Create orders entries together with their order items.
+    The items are generated in memory first so every order is inserted with its final
+    total_amount — no reload of the orders and no UPDATE pass afterwards. Order ids are
+    reserved from the sequence up front, so the insert is a one-way COPY.
     - customer_ids: list of customer_id
     - store_ids: list of store_id
+    - menu_ids, menu_prices: aligned arrays from load_menu_prices
     - guest_rate: fraction of orders with no customer (NULL)
-    Returns: list of order_id created (and order timestamps if needed).
+    - avg_items_per_order: mean of the (normal, clipped to 1..MAX_ITEMS_PER_ORDER) number of items per order
+    Returns: (order_ids, order_items) where order_items holds the item columns for
+    create_order_items, grouped by order in the same order as order_ids.
     """
     populate_logger.info(f"Starting to create {num_orders} orders...")
-    orders = []
-    now = datetime.now(timezone.utc)
+
+    # 1) Order items: for each order, choose how many items to attach (between 1 and MAX_ITEMS_PER_ORDER)
+    counts = np.clip(rng.normal(avg_items_per_order, 1.0, num_orders).astype(np.int32), 1, MAX_ITEMS_PER_ORDER)
+    total_items = int(counts.sum())
+    # allow repeats (same item twice)
+    item_idx = rng.integers(0, len(menu_ids), total_items)
+    quantities = rng.integers(1, 4, total_items)
+    price_mult = 1 + rng.uniform(-0.05, 0.10, total_items)  # small price variation
+    chosen_prices = menu_prices[item_idx]
+    price_at_time = np.round(chosen_prices * price_mult, 2)
+
+    # per-order totals: sum the line totals of each order's run of items
+    item_order = np.repeat(np.arange(num_orders), counts)
+    order_totals = np.round(np.bincount(item_order, weights=price_at_time * quantities, minlength=num_orders), 2)
+
+    # 2) Orders: every column is sampled in one vectorised call and only turned into tuples,
+    # chunk by chunk, as the COPY streams them
+    # pick a customer or NULL (guest)
+    customer_col = np.full(num_orders, None, dtype=object)
+    if customer_ids:
+        customer_idx = rng.integers(0, len(customer_ids), num_orders)
+        customer_col[:] = np.asarray(customer_ids, dtype=object)[customer_idx]
+        customer_col[rng.random(num_orders) < guest_rate] = None
+    store_col = np.asarray(store_ids)[rng.integers(0, len(store_ids), num_orders)]
     # We'll generate order timestamps uniformly over the past 365 days
     days_back = 365
-    for _ in tqdm(range(num_orders), desc="Creating orders", colour="green"):
-        # pick a customer or NULL (guest)
-        customer_id = random.choice(customer_ids) if customer_ids and random.random() > guest_rate else None
-        store_id = random.choice(store_ids)
-        # random timestamp in last year
-        offset_days = random.randint(0, days_back)
-        offset_seconds = random.randint(0, 86400 - 1)
-        order_timestamp = now - timedelta(days=offset_days, seconds=offset_seconds)
-        # placeholder total_amount = 0.0; will be updated after order_items inserted
-        total_amount = 0.00
-        status = random.choice(['Pending', 'Preparing', 'Completed', 'Cancelled'])
-        orders.append((customer_id, store_id, order_timestamp, total_amount, status))
-
-    insert = ("INSERT INTO orders (customer_id, store_id, order_timestamp, total_amount, status) "
-              "VALUES %s RETURNING order_id, order_timestamp")
+    now = np.datetime64(datetime.now(timezone.utc).replace(tzinfo=None), "us")
+    offsets = rng.integers(0, (days_back + 1) * 86400, num_orders)
+    order_timestamps = now - offsets.astype("timedelta64[s]")
+    status_col = rng.choice(['Pending', 'Preparing', 'Completed', 'Cancelled'], num_orders)
     try:
-        # batch insert (chunks to avoid blowing memory)
-        batch = 1000
-        created_orders = []
-        for i in range(0, len(orders), batch):
-            chunk = orders[i:i+batch]
-            rows = execute_values(cur, insert, chunk, fetch=True)
-            created_orders.extend(rows)  # list of tuples (order_id, order_timestamp)
-            populate_logger.info(f"Inserted orders: {len(created_orders)}/{len(orders)}")
-        populate_logger.info(f"Inserted {len(created_orders)} orders successfully.")
-        # return list of order_id (and timestamps if needed)
-        return created_orders
+        order_ids = reserve_ids(cur, "orders", "order_id", num_orders)
+        orders = iter_rows(order_ids, customer_col, store_col, order_timestamps, order_totals, status_col)
+        copy_binary(cur, "orders", ORDERS_COLUMNS, orders)
+        populate_logger.info(f"Inserted {len(order_ids)} orders successfully.")
     except Exception as e:
         populate_logger.exception(f"Error inserting orders: {e}")
-        raise    
+        raise
+
+    order_items = {
+        "counts": counts,
+        "item_id": menu_ids[item_idx],
+        "quantity": quantities,
+        "price_at_time_of_order": price_at_time,
+    }
+    return order_ids, order_items
 
-def create_order_items(cur, avg_items_per_order=5):
+def create_orders_server_side(cur, customer_ids, store_ids, menu_ids, menu_prices, num_orders=5000,
+                              guest_rate=0.10, avg_items_per_order=5):
     """
-    Creates order_items for all orders in the DB (or you can filter by recent orders).
-    This function:
-      1. Loads all existing orders (order_id)
-      2. Loads menu_items (item_id and price)
-      3. For each order, picks a Poisson-like number of items around avg_items_per_order
-         (at least 1), creates order_items rows (quantity 1-3), and calculates per-order totals.
-      4. Inserts all order_items in batches and then updates orders.total_amount with the computed totals.
+    Same distributions as create_orders + create_order_items, but generated entirely
+    inside PostgreSQL with generate_series() and random(): a single statement, and no
+    order rows are serialised on the client or sent over the wire.
+    Order ids are drawn from the orders sequence up front so the items and the final
+    totals can be built before either table is written.
     Returns: summary dict with counts and total revenue computed.
     """
-    populate_logger.info("Starting to create order_items for existing orders...")
-
-    # 1) Fetch orders
-    cur.execute("SELECT order_id FROM orders")
-    order_rows = cur.fetchall()
-    if not order_rows:
-        populate_logger.warning("No orders found in DB. Nothing to do.")
-        return {"orders": 0, "order_items": 0, "revenue": 0.0}
-    order_ids = [r[0] for r in order_rows]
-
-    # 2) Fetch menu item prices
-    cur.execute("SELECT item_id, price FROM menu_items")
-    menu_rows = cur.fetchall()
-    if not menu_rows:
-        raise RuntimeError("No menu_items found — cannot create order_items.")
-    menu_map = {r[0]: float(r[1]) for r in menu_rows}
-    menu_item_ids = list(menu_map.keys())
-
-    populate_logger.info(f"{len(order_ids)} orders and {len(menu_item_ids)} menu items loaded.")
-
-    order_item_rows = []   # tuples to insert: (order_id, item_id, quantity, price_at_time_of_order)
-    order_totals = {}      # order_id -> running total
-
-    # For each order, choose how many items to attach
-    for oid in order_ids:
-        item_count = max(1, int(random.gauss(avg_items_per_order, 1)))
-        # ensure at least 1
-        chosen_items = random.choices(menu_item_ids, k=item_count)  # allow repeats (same item twice)
-        total_for_order = 0.0
-        for item_id in chosen_items:
-            quantity = random.randint(1, 3)
-            price = menu_map[item_id]
-            price_at_time = round(price * (1 + random.uniform(-0.05, 0.10)), 2)  # small price variation
-            total_for_order += price_at_time * quantity
-            order_item_rows.append((oid, item_id, quantity, price_at_time))
-        order_totals[oid] = round(total_for_order, 2)
-
-    # 3) Insert order_items in batches
-    insert = ("INSERT INTO order_items (order_id, item_id, quantity, price_at_time_of_order) "
-              "VALUES %s RETURNING order_item_id")
+    populate_logger.info(f"Starting to create {num_orders} orders and their items server-side...")
+    params = {
+        "customer_ids": list(customer_ids),
+        "store_ids": list(store_ids),
+        "menu_ids": menu_ids.tolist(),
+        "menu_prices": menu_prices.tolist(),
+        "guest_rate": guest_rate,
+        "window_seconds": 366 * 86400,  # same 365 days back window as create_orders
+        "avg_items": avg_items_per_order,
+        "max_items": MAX_ITEMS_PER_ORDER,
+        "num_orders": num_orders,
+    }
     try:
-        inserted_count = 0
-        batch = 2000
-        for i in tqdm(range(0, len(order_item_rows), batch), desc="Inserting order_items", colour="green"):
-            chunk = order_item_rows[i:i+batch]
-            rows = execute_values(cur, insert, chunk, fetch=True)
-            inserted_count += len(rows)
-            populate_logger.info(f"Inserted order_items: {inserted_count}/{len(order_item_rows)}")
+        cur.execute(SQL_SERVER_SIDE_ORDERS, params)
+        order_count, item_count, total_revenue = cur.fetchone()
     except Exception as e:
-        populate_logger.exception(f"Error inserting order_items: {e}")
+        populate_logger.exception(f"Error generating orders server-side: {e}")
         raise
 
-    # 4) Update orders.total_amount using the order_totals computed
-    populate_logger.info("Updating orders.total_amount from computed totals...")
+    populate_logger.info(f"Inserted {order_count} orders and {item_count} order_items; "
+                         f"total revenue ~ {total_revenue:.2f}")
+    return {"orders": order_count, "order_items": item_count, "revenue": round(float(total_revenue), 2)}
+
+def create_order_items(cur, order_ids, order_items):
+    """
+    Insert the order_items generated by create_orders with one binary COPY.
+    - order_ids: order ids assigned by create_orders
+    - order_items: item columns returned by create_orders; "counts" is the number
+      of items of each order, in the same order as order_ids
+    Returns: summary dict with counts and total revenue computed.
+    """
+    populate_logger.info("Starting to create order_items...")
+
+    quantities = order_items["quantity"]
+    price_at_time = order_items["price_at_time_of_order"]
+    # tuples to insert: (order_id, item_id, quantity, price_at_time_of_order)
+    order_item_rows = iter_rows(
+        np.repeat(order_ids, order_items["counts"]),
+        order_items["item_id"],
+        quantities,
+        price_at_time
+    )
+
     try:
-        # Prepare list of (total_amount, order_id) for update
-        update_pairs = [(order_totals[oid], oid) for oid in order_totals.keys()]
-        # Update in batches using CASE to avoid many separate UPDATEs
-        # Build a query like: UPDATE orders SET total_amount = data.total_amount FROM (VALUES (...) ) AS data(total_amount, order_id) WHERE orders.order_id = data.order_id;
-        batch = 500
-        for i in range(0, len(update_pairs), batch):
-            chunk = update_pairs[i:i+batch]
-            # build the VALUES clause
-            values_sql = ','.join(['(%s, %s)'] * len(chunk))
-            flat = [val for pair in chunk for val in pair]  # flatten (amount, oid) pairs
-            sql = ("UPDATE orders SET total_amount = data.total_amount FROM (VALUES " +
-                   values_sql +
-                   ") AS data(total_amount, order_id) WHERE orders.order_id = data.order_id")
-            cur.execute(sql, flat)
-        populate_logger.info("Orders updated successfully.")
+        inserted_count = copy_binary(cur, "order_items", ORDER_ITEMS_COLUMNS, order_item_rows)
     except Exception as e:
-        populate_logger.exception(f"Error updating orders total_amount: {e}")
+        populate_logger.exception(f"Error inserting order_items: {e}")
         raise
 
     # compute total revenue
-    total_revenue = sum(order_totals.values())
+    total_revenue = float(np.dot(price_at_time, quantities))
     populate_logger.info(f"Inserted {inserted_count} order_items; total revenue ~ {total_revenue:.2f}")
 
     return {"orders": len(order_ids), "order_items": inserted_count, "revenue": round(total_revenue, 2)}
 
 
+# ---------- Parallel population ----------
+def init_worker():
+    """
+    Give each worker process its own random streams; forked workers would otherwise
+    all continue from the parent's generator state.
+    """
+    global rng
+    rng = np.random.default_rng()
+    random.seed()
+    fake.seed_instance()
+
+def run_creator(cfg, creator, *args):
+    """
+    Run one creator (e.g. create_customers) in a worker process, on its own
+    connection and in its own transaction, committed before returning.
+    Returns: whatever the creator returns (the ids it assigned).
+    """
+    conn = get_conn(cfg)
+    conn.autocommit = False
+    try:
+        with conn:
+            with conn.cursor() as cur:
+                cur.execute("SET LOCAL synchronous_commit = off")
+                return creator(cur, fake, *args)
+    finally:
+        conn.close()
+        # worker processes exit without running the logging shutdown hook
+        flush_logs()
+
+
 # ---------- Main Function ----------
 def main():
     parser = argparse.ArgumentParser(description="Populate RushMore Pizzeria Enterprise Database.")
@@ -419,28 +826,67 @@ def main():
     parser.add_argument("--ingredients", type=int, default=50, help="Number of ingredients to create")
     parser.add_argument("--menu", type=int, default=30, help="Number of menu items to create")
     parser.add_argument("--orders", type=int, default=5000, help="Number of orders to create")
+    parser.add_argument("--server-side-orders", action="store_true",
+                        help="Generate orders and order items inside PostgreSQL instead of in Python")
     args = parser.parse_args()
 
-    faker = Faker()
-    faker.unique.clear()  # reset uniqueness between runs
-
     cfg = load_config(args.config)
 
     with get_conn(cfg) as conn:
+        conn.autocommit = False
         with conn.cursor() as cur:
-            cur.execute("SET search_path TO pizzeria;")
             populate_logger.info("------ Starting Data Population ------")
-
-            # Create tables data sequentially
-            store_ids = create_stores(cur, faker, args.stores)
-            customer_ids = create_customers(cur, faker, args.customers)
-            ingredient_ids = create_ingredients(cur, faker, args.ingredients)
-            menu_item_ids = create_menu_items(cur, faker, args.menu)
-            create_item_ingredients(cur, menu_item_ids, ingredient_ids)
-            create_orders(cur, customer_ids, store_ids, args.orders)
-            create_order_items(cur)
-
+            # committed on its own: its ALTER TABLE locks would otherwise block the worker sessions
+            index_ddl = prepare_bulk_load(cur)
             conn.commit()
+
+            # All rows created on this connection go in one transaction with a single commit.
+            # The load is re-runnable from scratch, so that commit needn't wait for the WAL flush;
+            # SET LOCAL keeps the final (restoring) commit fully durable.
+            loaded = False
+            try:
+                cur.execute("SET LOCAL synchronous_commit = off")
+                store_ids = create_stores(cur, fake, args.stores)
+                ingredient_ids = create_ingredients(cur, fake, args.ingredients)
+
+                # customers and menu items don't depend on each other: create them concurrently,
+                # each in a worker process with its own connection
+                flush_logs()
+                with ProcessPoolExecutor(max_workers=2, initializer=init_worker) as pool:
+                    customers_job = pool.submit(run_creator, cfg, create_customers, args.customers)
+                    menu_job = pool.submit(run_creator, cfg, create_menu_items, args.menu)
+                    customer_ids = customers_job.result()
+                    menu_item_ids = menu_job.result()
+
+                create_item_ingredients(cur, menu_item_ids, ingredient_ids)
+                menu_ids, menu_prices = load_menu_prices(cur)
+                if args.server_side_orders:
+                    create_orders_server_side(cur, customer_ids, store_ids, menu_ids, menu_prices, args.orders)
+                else:
+                    order_ids, order_items = create_orders(cur, customer_ids, store_ids, menu_ids, menu_prices,
+                                                           args.orders)
+                    create_order_items(cur, order_ids, order_items)
+                conn.commit()
+                loaded = True
+            except BaseException as e:
+                # interrupts too: the finally below commits, so nothing half-loaded may be left open
+                populate_logger.exception(
+                    f"Data population failed, rolling back: {e!r}. "
+                    "Customers and menu items already committed by the worker processes are kept."
+                )
+                conn.rollback()
+                raise
+            finally:
+                # restore logging and indexes whether or not the load went through
+                try:
+                    finish_bulk_load(cur, index_ddl)
+                    conn.commit()
+                except Exception as e:
+                    if loaded:
+                        raise
+                    # don't let this mask the error that aborted the load
+                    populate_logger.exception(f"Error restoring tables and indexes after the failed load: {e}")
+                    conn.rollback()
             populate_logger.info("------ Data Population Completed Successfully ------")
 
 